@@ -1,4 +1,6 @@
 import os
+import re
+import sys
 import logging
 import discord
 from discord import app_commands
@@ -6,6 +8,13 @@ from discord.ext import commands
 from pathlib import Path
 import json
 import datetime
+import asyncio
+
+try:
+    import orjson  # optional, faster parser
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # bot.py - Discord bot template with slash (application) commands
 # Requires: discord.py 2.0+ (pip install -U "discord.py")
@@ -30,69 +39,174 @@ if token_file.exists():
     except Exception:
         TOKEN = None
 config_file = Path(__file__).parent / "config.json"
-config = json.load(open(config_file))
-if not config.get("WorkThreadCategoryID"):
-    print("WorkThreadCategoryID not set in config.json")
-    exit(1)
-if not config.get("ServerID"):
-    print("ServerID not set in config.json")
-    exit(1)
-if not config.get("Commitees") or not config.get("Places") or not config.get("event_types"):
-    print("Commitees, Places or event_types not set in config.json")
-    exit(1)
+# parse from bytes: both orjson and json.loads accept them, skipping the text decode layer
+config = _json_loads(config_file.read_bytes())
+REQUIRED_CONFIG_KEYS = ("WorkThreadCategoryID", "ServerID", "Commitees", "Places", "event_types")
+missing = [k for k in REQUIRED_CONFIG_KEYS if not config.get(k)]
+if missing:
+    raise SystemExit(f"Missing config keys in config.json: {', '.join(missing)}")
 if not TOKEN:
-    print("DISCORD_TOKEN not set in environment or token.cfg")
-    exit(1)
+    raise SystemExit("DISCORD_TOKEN not set in environment or token.cfg")
+# config is immutable at runtime: bind the settings the handlers need once
 GUILD_ID = config.get("ServerID")
-intents = discord.Intents.default()
+GUILD_ID_INT = int(GUILD_ID)
+try:
+    WORK_THREAD_CATEGORY_ID = int(config["WorkThreadCategoryID"])
+except ValueError:
+    raise SystemExit("WorkThreadCategoryID must be a channel id") from None
+SA_ROLE = config.get("SARoleID")
+# SARoleID is normally a role id; a non-numeric value is treated as the role name
+try:
+    SA_ROLE_ID = int(SA_ROLE) if SA_ROLE else None
+except ValueError:
+    SA_ROLE_ID = None
+# interned so the Choice values share one string object with any later comparisons
+COMMITEES = tuple(sys.intern(c) for c in config["Commitees"])
+PLACES = tuple(sys.intern(p) for p in config["Places"])
+EVENT_TYPES = tuple(sys.intern(e) for e in config["event_types"])
+# shared Choice lists (app_commands.choices only accepts lists) so later commands can reuse them
+COMMITEE_CHOICES = [app_commands.Choice(name=c, value=c) for c in COMMITEES]
+PLACE_CHOICES = [app_commands.Choice(name=p, value=p) for p in PLACES]
+EVENT_TYPE_CHOICES = [app_commands.Choice(name=e, value=e) for e in EVENT_TYPES]
+UTC = datetime.timezone.utc
+# work thread channels are named workthread-<event name>-DD-MM-YYYY (create-event also accepts D-M-YYYY)
+WORKTHREAD_RE = re.compile(r"^workthread-.+-(\d{1,2})-(\d{1,2})-(\d{4})$")
+# only subscribe to what the bot uses: guild/channel state and scheduled events for the slash commands
+intents = discord.Intents(guilds=True, guild_scheduled_events=True)
+
+bot = commands.Bot(command_prefix="!", intents=intents)  # prefix not used for slash commands but required by commands.Bot
 
-bot = commands.Bot(command_prefix="!", intents=intents)  # prefix not used for slash commands but kept for convenience
+# Helper: guild object for the configured server (ServerID is required), used for command sync
+dev_guild = discord.Object(id=GUILD_ID_INT)
 
-# Helper: get guild object for fast development sync (if provided)
-dev_guild = discord.Object(id=int(GUILD_ID)) if GUILD_ID else None
+
+def _resolve_guild(interaction: discord.Interaction):
+    """Return the interaction's guild, falling back to the configured guild."""
+    return interaction.guild or bot.get_guild(GUILD_ID_INT)
 
 
 @bot.event
 async def on_ready():
-    """Called when the bot is ready. Syncs application commands."""
-    if dev_guild:
-        # Sync commands to a single guild (fast). Useful during development.
-        bot.tree.clear_commands(guild=dev_guild)  # clear existing commands to avoid duplicates
-        logging.info(f"Cleared existing commands in guild {GUILD_ID}")
-        await bot.tree.sync(guild=dev_guild)
-        logging.info(f"Synced slash commands to guild {GUILD_ID}")
-    await bot.tree.sync()
-    logging.info("Synced global slash commands")
+    """Called when the bot is ready."""
     logging.info(f"Logged in as {bot.user} (ID: {bot.user.id})")
 
 
+@bot.event
+async def setup_hook():
+    """Called once before connecting to the gateway. Registers and syncs application commands."""
+    # on_ready fires again on every reconnect, so one-time work belongs here
+    bot.tree.add_command(event_group)  # register the group
+    # Commands are registered on the configured guild only (guild sync is fast).
+    bot.tree.copy_global_to(guild=dev_guild)
+    await bot.tree.sync(guild=dev_guild)
+    logging.info(f"Synced slash commands to guild {GUILD_ID}")
+    # Earlier versions synced the commands globally; sync an empty global list so those
+    # stale copies don't show up next to the guild commands as duplicates.
+    bot.tree.clear_commands(guild=None)
+    await bot.tree.sync()
+    logging.info("Cleared global slash commands")
+
+
+# ids of the work thread text channels, so delete-all-thread doesn't scan every guild channel.
+# Rebuilt when a guild becomes available and kept current from the channel gateway events.
+_workthread_channel_ids: set[int] = set()
+
+
+def _is_workthread(channel) -> bool:
+    return isinstance(channel, discord.TextChannel) and WORKTHREAD_RE.match(channel.name) is not None
+
+
+@bot.event
+async def on_guild_available(guild: discord.Guild):
+    """Index the guild's existing work thread channels."""
+    _workthread_channel_ids.update(c.id for c in guild.text_channels if WORKTHREAD_RE.match(c.name))
+
+
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel):
+    if _is_workthread(channel):
+        _workthread_channel_ids.add(channel.id)
+
+
+@bot.event
+async def on_guild_channel_update(before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+    if _is_workthread(after):
+        _workthread_channel_ids.add(after.id)
+    else:
+        _workthread_channel_ids.discard(after.id)
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    _workthread_channel_ids.discard(channel.id)
+
+
 # Example of a command group (subcommands): /math multiply
 event_group = app_commands.Group(name="events", description="Commands related to events")
 
 
+def _has_role(member: discord.Member, role: int | str) -> bool:
+    """Return whether member has the role, given by id or by name."""
+    # numeric id is a dict lookup in discord.py, fallback to name
+    if isinstance(role, int):
+        return member.get_role(role) is not None
+    return any(r.name == role for r in member.roles)
+
+
+def requires_role(role: int | str | None, role_label: str):
+    """App command check: only allow members with the given role (id or name)."""
+    async def predicate(interaction: discord.Interaction) -> bool:
+        if not role:
+            raise app_commands.CheckFailure(f"{role_label} role not configured on the bot.")
+        member = interaction.user
+        if not isinstance(member, discord.Member):
+            # not in a guild context
+            raise app_commands.CheckFailure("This command can only be used in a server.")
+        if not _has_role(member, role):
+            raise app_commands.CheckFailure(f"You must have the {role_label} role to use this command.")
+        return True
+    return app_commands.check(predicate)
+
+
 # Helper check: only allow users with the SA role (name or ID) defined in config.json
-async def _check_sa_role(interaction: discord.Interaction) -> bool:
-    sa_value = config.get("SARoleID")
-    if not sa_value:
-        raise app_commands.CheckFailure("SA role not configured on the bot.")
-    member = interaction.user
-    if not isinstance(member, discord.Member):
-        # not in a guild context
-        raise app_commands.CheckFailure("This command can only be used in a server.")
-    # try numeric id first, fallback to name
-    allowed = False
+require_sa_role = requires_role(SA_ROLE_ID if SA_ROLE_ID is not None else SA_ROLE, "SA")
+
+
+def _parse_event_times(
+    date_str: str, time_str: str
+) -> tuple[datetime.datetime, datetime.datetime, list[str]] | None:
+    """Parse a DD-MM-YYYY date and HH:MM-HH:MM time into aware UTC start/end datetimes.
+
+    Returns None if the date is invalid. An invalid time is set to midnight with a warning,
+    and a missing end time defaults to one hour after the start.
+    """
+    # built with the datetime constructor rather than strptime (Discord expects aware datetimes)
     try:
-        sa_id = int(sa_value)
-        allowed = any(r.id == sa_id for r in member.roles)
-    except Exception:
-        allowed = any(r.name == str(sa_value) for r in member.roles)
-    if not allowed:
-        raise app_commands.CheckFailure("You must have the SA role to use this command.")
-    return True
+        day, month, year = map(int, date_str.strip().split("-"))
+        midnight = datetime.datetime(year, month, day, tzinfo=UTC)
+    except ValueError:
+        return None
+
+    warnings = []
+
+    def at(part: str) -> datetime.datetime:
+        try:
+            hh, mm = map(int, part.split(":"))
+            return midnight.replace(hour=hh, minute=mm)
+        except ValueError:
+            warnings.append("Time format invalid, set to default (00:00), edit the event to correct it.")
+            return midnight
+
+    # split start and end times on the first '-'
+    start_part, _, end_part = time_str.strip().partition("-")
+    start_dt = at(start_part.strip())
+    end_part = end_part.strip()
+    end_dt = at(end_part) if end_part else start_dt + datetime.timedelta(hours=1)
+    return start_dt, end_dt, warnings
 
 
 @event_group.command(name="create-event", description="Create a work thread")
-@app_commands.check(_check_sa_role)
+@require_sa_role
 @app_commands.describe( 
     event_name = "Name of the event", 
     date="DD-MM-YYYY date of the event", 
@@ -103,9 +217,9 @@ async def _check_sa_role(interaction: discord.Interaction) -> bool:
     create_work_thread="Whether to create a work thread for the event (default: true)",
     create_event = "Whether to create the event in calendar (default: true)")
 @app_commands.choices(  
-    comitee=[app_commands.Choice(name=c, value=c) for c in config["Commitees"]],
-    place = [app_commands.Choice(name=p, value=p) for p in config["Places"]],
-    event_type = [app_commands.Choice(name=e, value=e) for e in config["event_types"]])
+    comitee=COMMITEE_CHOICES,
+    place=PLACE_CHOICES,
+    event_type=EVENT_TYPE_CHOICES)
 async def create_event(
     interaction: discord.Interaction, 
     event_name: str, 
@@ -117,134 +231,132 @@ async def create_event(
     create_work_thread: bool = True,
     create_event: bool = True):
     """Creates a new event with the given parameters."""
+    # defer first: channel/event creation can be slow or rate-limited
+    await interaction.response.defer(ephemeral=True, thinking=True)
     response = f"Creating event '{event_name}' on {date} at {time} hosted by {comitee.value} in {place.value} of type {event_type.value}."
     if create_work_thread:
         response += "\n A work thread will be created."
     if create_event:
         response += "\n The event will be added to the calendar."
-    await interaction.response.send_message(response, ephemeral=True)
+    await interaction.followup.send(response, ephemeral=True)
 
-    # create a new work thread channel in the WorkThreadCategory with name event_name-DD-MM-YYYY
-    if create_work_thread:
-        category_id = config.get("WorkThreadCategoryID")
-        # prefer interaction.guild, fallback to configured guild id
-        guild_obj = interaction.guild or bot.get_guild(int(GUILD_ID)) if GUILD_ID else None
-        if not guild_obj:
-            await interaction.followup.send("Guild not available to create the work thread.", ephemeral=True)
-        else:
-            channel_name = f"workthread-{event_name}-{date}"
-            # category may be an ID in config; get the CategoryChannel object if possible
-            category_channel = None
-            if category_id is not None:
-                try:
-                    category_channel = guild_obj.get_channel(int(category_id))
-                except Exception:
-                    category_channel = None
-            thread_channel = await guild_obj.create_text_channel(channel_name, category=category_channel)
-            await thread_channel.send(f"Work thread for event '{event_name}' on {date} at {time}.")
-            await interaction.followup.send(f"Work thread created: {thread_channel.mention}", ephemeral=True)
-    
-    #create a discord event in the guild
-    if create_event:
-
-        # parse date and start/end time. time will be "HH:MM-HH:MM"
-        start_dt = None
-        end_dt = None
-        date_str = date.strip()
-        time_str = time.strip()
+    guild_obj = _resolve_guild(interaction)
 
-        # split start and end times (only first '-' splits to allow hyphens in other contexts)
-        if "-" in time_str:
-            start_part, end_part = [p.strip() for p in time_str.split("-", 1)]
-        else:
-            start_part = time_str
-            end_part = None
-
-        async def try_parse(dt_str: str) -> datetime.datetime:
-            """Try to parse a time string in various formats."""
-            # format is DD-MM-YYYY HH:MM, set to midnight if no time provided or if format is invalid,
-            # and send a warning message saying to edit the event
-            try:
-                return datetime.datetime.strptime(dt_str, "%d-%m-%Y %H:%M")
-            except ValueError:
-                await interaction.followup.send("Time format invalid, set to default (00:00), edit the event to correct it.", ephemeral=True)
-                return datetime.datetime.strptime(f"{date_str} 00:00", "%d-%m-%Y %H:%M")
-
-        # try parse start
-        start_dt = await try_parse(f"{date_str} {start_part}")
-
-        # try parse end (use provided end_part if available, otherwise default to 1 hour after start)
-        if end_part:
-            end_dt = await try_parse(f"{date_str} {end_part}")
+    # parse event times up front so the work thread and the event can be created concurrently
+    event_times = None
+    if create_event:
+        event_times = _parse_event_times(date, time)
+        if event_times is None:
+            await interaction.followup.send("Date format invalid (expected DD-MM-YYYY), the event was not created.", ephemeral=True)
         else:
-            end_dt = start_dt + datetime.timedelta(hours=1)
+            for warning in event_times[2]:
+                await interaction.followup.send(warning, ephemeral=True)
 
-        # keep behavior compatible with downstream code that expects start_dt variable (timezone applied later)
-        # start_dt and end_dt are naive datetimes here; later code will set tzinfo as needed
-        # make timezone-aware UTC (Discord expects an aware datetime)
-        start_dt = start_dt.replace(tzinfo=datetime.timezone.utc)
-        end_dt = end_dt.replace(tzinfo=datetime.timezone.utc)
+    async def _create_work_thread():
+        # create a new work thread channel in the WorkThreadCategory with name event_name-DD-MM-YYYY
+        if not guild_obj:
+            await interaction.followup.send("Guild not available to create the work thread.", ephemeral=True)
+            return
+        channel_name = f"workthread-{event_name}-{date}"
+        # get the CategoryChannel object if possible (None creates the channel uncategorized)
+        category_channel = guild_obj.get_channel(WORK_THREAD_CATEGORY_ID)
+        try:
+            thread_channel = await guild_obj.create_text_channel(
+                channel_name, category=category_channel, reason=f"create-event by {interaction.user}"
+            )
+            _workthread_channel_ids.add(thread_channel.id)
+            # the greeting in the new channel and the confirmation to the user are independent
+            await asyncio.gather(
+                thread_channel.send(f"Work thread for event '{event_name}' on {date} at {time}."),
+                interaction.followup.send(f"Work thread created: {thread_channel.mention}", ephemeral=True),
+            )
+        except Exception as e:
+            await interaction.followup.send(f"Failed to create work thread: {e}", ephemeral=True)
 
-        # get guild object (prefer interaction.guild)
-        guild_obj = interaction.guild or bot.get_guild(int(GUILD_ID)) if GUILD_ID else None
+    async def _create_scheduled_event(start_dt: datetime.datetime, end_dt: datetime.datetime):
+        # create a discord event in the guild
         if not guild_obj:
             await interaction.followup.send("Guild not available to create the event.", ephemeral=True)
-        else:
-            try:
-                # Create a scheduled event. Use an external event (no voice/stage channel).
-                event = await guild_obj.create_scheduled_event(
-                    name=event_name,
-                    start_time=start_dt,
-                    end_time=end_dt,
-                    description=f"{event_type.value} hosted by {comitee.value} at {place.value}",
-                    location=place.value,
-                    entity_type=discord.EntityType.external,
-                    privacy_level=discord.PrivacyLevel.guild_only,
-                )
-                await interaction.followup.send(f"Discord event created: {event.name} (ID: {event.id})", ephemeral=True)
-            except AttributeError:
-                # guild.create_scheduled_event not available in this discord.py version
-                await interaction.followup.send("This bot's discord.py version does not support creating scheduled events.", ephemeral=True)
-            except Exception as e:
-                await interaction.followup.send(f"Failed to create discord event: {e}", ephemeral=True)
+            return
+        try:
+            # Create a scheduled event. Use an external event (no voice/stage channel).
+            event = await guild_obj.create_scheduled_event(
+                name=event_name,
+                start_time=start_dt,
+                end_time=end_dt,
+                description=f"{event_type.value} hosted by {comitee.value} at {place.value}",
+                location=place.value,
+                entity_type=discord.EntityType.external,
+                privacy_level=discord.PrivacyLevel.guild_only,
+            )
+            await interaction.followup.send(f"Discord event created: {event.name} (ID: {event.id})", ephemeral=True)
+        except AttributeError:
+            # guild.create_scheduled_event not available in this discord.py version
+            await interaction.followup.send("This bot's discord.py version does not support creating scheduled events.", ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(f"Failed to create discord event: {e}", ephemeral=True)
+
+    # the work thread and the scheduled event don't depend on each other
+    jobs = []
+    if create_work_thread:
+        jobs.append(_create_work_thread())
+    if event_times is not None:
+        start_dt, end_dt, _ = event_times
+        jobs.append(_create_scheduled_event(start_dt, end_dt))
+    await asyncio.gather(*jobs)
 
 @event_group.command(name="delete-work-thread", description="Delete the current channel if it is a work thread")
-@app_commands.check(_check_sa_role)
+@require_sa_role
 async def delete_work_thread(interaction: discord.Interaction):
     "Delete the current channel if it is a work thread."
     channel = interaction.channel
     if channel and "workthread-" in channel.name:
         await channel.delete()
+        _workthread_channel_ids.discard(channel.id)
         await interaction.response.send_message(f"Work thread channel '{channel.name}' deleted.", ephemeral=True)
 
 @event_group.command(name="delete-all-thread", description="Delete all work threads for events older than today")
-@app_commands.check(_check_sa_role)
+@require_sa_role
 async def delete_all_work_threads(interaction: discord.Interaction):
     """Delete all work thread channels for events older than today."""
-    guild_obj = interaction.guild or bot.get_guild(int(GUILD_ID)) if GUILD_ID else None
+    # deleting many channels can exceed the 3 second interaction response deadline
+    await interaction.response.defer(ephemeral=True)
+    guild_obj = _resolve_guild(interaction)
     if not guild_obj:
-        await interaction.response.send_message("Guild not available to delete work threads.", ephemeral=True)
+        await interaction.followup.send("Guild not available to delete work threads.", ephemeral=True)
         return
 
-    now = datetime.datetime.now(datetime.timezone.utc)
+    # names only carry a day, so compare plain dates (taking "today" in UTC like the events)
+    today = datetime.datetime.now(UTC).date()
+    stale = []
+    for channel_id in tuple(_workthread_channel_ids):
+        channel = guild_obj.get_channel(channel_id)
+        if channel is None:
+            # channel of another guild, or gone while disconnected
+            continue
+        m = WORKTHREAD_RE.match(channel.name)
+        if not m:
+            continue
+        d, mo, y = m.groups()
+        try:
+            event_date = datetime.date(int(y), int(mo), int(d))
+        except ValueError:
+            logging.warning(f"Invalid date format in channel name: {channel.name}")
+            continue
+        if event_date < today:
+            stale.append(channel)
+
+    # issue the deletes concurrently; discord.py's HTTP client handles the rate-limit bucket
+    results = await asyncio.gather(*(ch.delete() for ch in stale), return_exceptions=True)
     deleted_channels = []
-    for channel in guild_obj.channels:
-        if channel.name.startswith("workthread-"):
-            # extract date from channel name
-            parts = channel.name.split("-")
-            date = parts[-3:]  # last three parts should be DD-MM-YYYY
-            if len(date) == 3:
-                date_str = "-".join(parts)
-                try:
-                    event_date = datetime.datetime.strptime(date_str, "%d-%m-%Y").replace(tzinfo=datetime.timezone.utc)
-                    if event_date < now:
-                        await channel.delete()
-                        deleted_channels.append(channel.name)
-                except ValueError:
-                    print(f"Invalid date format in channel name: {channel.name}")
-    await interaction.response.send_message(f"Deleted work thread channels:\n {',\n'.join(deleted_channels)}", ephemeral=True)
-
-bot.tree.add_command(event_group)  # register the group
+    for channel, result in zip(stale, results):
+        if isinstance(result, Exception):
+            logging.warning(f"Failed to delete work thread channel {channel.name}: {result}")
+        else:
+            _workthread_channel_ids.discard(channel.id)
+            deleted_channels.append(channel.name)
+    deleted_list = ",\n".join(deleted_channels)
+    await interaction.followup.send(f"Deleted work thread channels:\n {deleted_list}", ephemeral=True)
 
 # Global error handler for app commands
 @bot.tree.error